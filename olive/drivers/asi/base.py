@@ -1,4 +1,14 @@
+import array
 import logging
+import math
+from functools import partial
+
+try:
+    import fcntl
+    import termios
+except ImportError:
+    # not a POSIX platform
+    fcntl = termios = None
 
 import trio
 from serial import Serial
@@ -18,21 +28,41 @@ __all__ = ["ASIAxis", "ASISerialCommandController"]
 
 logger = logging.getLogger(__name__)
 
+# STATUS polling interval bounds, in seconds
+POLL_INTERVAL_MIN = 0.005
+POLL_INTERVAL_MAX = 0.1
+# concurrent waiters share a STATUS reply that is younger than this, in seconds
+BUSY_CACHE_TTL = 0.005
+# initial size of the receive buffer, grows for long multi-line responses
+RX_BUFFER_SIZE = 64
+# serial_struct flag toggled by Serial.set_low_latency_mode
+ASYNC_LOW_LATENCY = 0x2000
+
+
+def _encode(value):
+    return value if isinstance(value, bytes) else str(value).encode("ascii")
+
 
 class ASIAxis(Axis):
     def __init__(self, parent, axis, *args, **kwargs):
         super().__init__(parent.driver, *args, parent, **kwargs)
         self._axis = axis
 
+        # axis identifier is fixed, precompute the command fragments
+        self._axis_key = axis.encode("ascii")
+        self._axis_query = self._axis_key + b"?"
+        self._axis_limit_query = self._axis_key + b"-"
+
         self._info = None
         self._multiplier = 1
+        self._motor_control = None
 
     ##
 
     async def test_open(self):
         try:
             await self.open()
-            flag = self.parent.send_cmd("RS", f"{self.axis}-")
+            flag = await self.parent.send_cmd(b"RS", self._axis_limit_query)
             if flag == "D":
                 raise UnsupportedClassError("axis not connected")
             logger.info(f".. {self.info}")
@@ -44,8 +74,13 @@ class ASIAxis(Axis):
         self._multiplier = await self.get_property("unit_multiplier")
 
     async def _close(self):
-        self.stop()
+        await self.stop()
         self._info = None
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Drop cached controller responses, e.g. after a reconnect."""
+        self._motor_control = None
 
     ##
 
@@ -53,11 +88,13 @@ class ASIAxis(Axis):
         return ("motor_control", "unit_multiplier")
 
     async def _get_motor_control(self):
-        status = self.parent.send_cmd("MC", f"{self.axis}?")
-        return status == "1"
+        if self._motor_control is None:
+            status = await self.parent.send_cmd(b"MC", self._axis_query)
+            self._motor_control = status == "1"
+        return self._motor_control
 
     async def _get_unit_multiplier(self):
-        unit_mul = self.parent.send_cmd("UM", f"{self.axis}?")
+        unit_mul = await self.parent.send_cmd(b"UM", self._axis_query)
 
         # ":X=100000.00000 A"
         unit_mul = unit_mul.split(" ")[0][1:]
@@ -68,79 +105,65 @@ class ASIAxis(Axis):
     ##
 
     async def go_home(self, blocking=True):
-        self.parent.send_cmd("!", self.axis)
+        await self.parent.send_cmd(b"!", self._axis_key)
         await trio.sleep(0)
         if blocking:
             await self.wait()
 
-    def get_position(self):
-        response = self.parent.send_cmd("W", f"{self.axis}")
+    async def get_position(self):
+        response = await self.parent.send_cmd(b"W", self._axis_key)
         pos = float(response) / self._multiplier
         return pos
 
     async def move_absolute(self, pos, blocking=True):
-        # 0.1 micron per unit step
-        pos *= self._multiplier
-        # remove decimal
-        pos = int(pos)
-        self.parent.send_cmd("M", **{self.axis: pos})
-        await trio.sleep(0)
-        if blocking:
-            await self.wait()
+        await self.parent.move_absolute({self: pos}, blocking=blocking)
 
     async def move_relative(self, pos, blocking=True):
-        # 0.1 micron per unit step
-        pos *= self._multiplier
-        # remove decimal
-        pos = int(pos)
-        self.parent.send_cmd("R", **{self.axis: pos})
-        await trio.sleep(0)
-        if blocking:
-            await self.wait()
+        await self.parent.move_relative({self: pos}, blocking=blocking)
 
-    def move_continuous(self, vel):
-        self.parent.send_cmd("VE", f"{self.axis}={vel}")
+    async def move_continuous(self, vel):
+        await self.parent.send_cmd(b"VE", self._assign(vel))
 
     ##
 
-    def get_velocity(self):
-        response = self.parent.send_cmd("S", f"{self.axis}?")
+    async def get_velocity(self):
+        response = await self.parent.send_cmd(b"S", self._axis_query)
         return float(response.split("=")[1])
 
-    def set_velocity(self, vel):
-        self.parent.send_cmd("S", self.axis, vel)
+    async def set_velocity(self, vel):
+        await self.parent.send_cmd(b"S", self._axis_key, vel)
 
     ##
 
-    def get_acceleration(self):
-        response = self.parent.send_cmd("AC", f"{self.axis}?")
+    async def get_acceleration(self):
+        response = await self.parent.send_cmd(b"AC", self._axis_query)
         return float(response.split("=")[1])
 
-    def set_acceleration(self, acc):
-        self.parent.send_cmd("AC", self.axis, acc)
+    async def set_acceleration(self, acc):
+        await self.parent.send_cmd(b"AC", self._axis_key, acc)
 
     ##
 
-    def set_origin(self):
-        self.parent.send_cmd("H", f"{self.axis}")
+    async def set_origin(self):
+        await self.parent.send_cmd(b"H", self._axis_key)
 
-    def get_limits(self):
-        response = self.parent.send_cmd("SL", f"{self.axis}?")
+    async def get_limits(self):
+        response = await self.parent.send_cmd(b"SL", self._axis_query)
         lo = float(response.split("=")[1])
-        response = self.parent.send_cmd("SU", f"{self.axis}?")
+        response = await self.parent.send_cmd(b"SU", self._axis_query)
         hi = float(response.split("=")[1])
         return lo, hi
 
-    def get_limit_status(self):
-        flag = self.parent.send_cmd("RS", f"{self.axis}-")
+    async def get_limit_status(self):
+        flag = await self.parent.send_cmd(b"RS", self._axis_limit_query)
         return {"U": LimitStatus.UpperLimit, "L": LimitStatus.LowerLimit}.get(
             flag, LimitStatus.WithinRange
         )
 
-    def set_limits(self, lim):
+    async def set_limits(self, lim):
         lo, hi = tuple(lim)
-        self.parent.send_cmd("SL", **{self.axis: lo})
-        self.parent.send_cmd("SU", **{self.axis: hi})
+        await self.parent.send_cmd(b"SL", self._assign(lo))
+        await self.parent.send_cmd(b"SU", self._assign(hi))
 
     ##
 
@@ -154,21 +177,21 @@ class ASIAxis(Axis):
         logger.debug(f"axis {self.axis} calibration started...")
 
         # reset limit to an impossible value (1 meter)
-        self.set_limits((-1000, 1000))
+        await self.set_limits((-1000, 1000))
 
         # remember current position
-        ref = self.get_position()
+        ref = await self.get_position()
 
         # run until upper limit
-        self.move_continuous(vel)
-        while self.get_limit_status() != LimitStatus.UpperLimit:
+        await self.move_continuous(vel)
+        while await self.get_limit_status() != LimitStatus.UpperLimit:
             await trio.sleep(0)
-        hi = self.get_position()
+        hi = await self.get_position()
         # run until lower limit
-        self.move_continuous(-vel)
-        while self.get_limit_status() != LimitStatus.LowerLimit:
+        await self.move_continuous(-vel)
+        while await self.get_limit_status() != LimitStatus.LowerLimit:
             await trio.sleep(0)
-        lo = self.get_position()
+        lo = await self.get_position()
         logger.debug(f".. current {self.axis} limits [{lo}, {hi}]")
 
         # move to center
@@ -176,19 +199,39 @@ class ASIAxis(Axis):
         half = full / 2.0
         await self.move_relative(half)
         # reset
-        self.set_origin()
+        await self.set_origin()
         # update limits
-        self.set_limits((-half, half))
+        await self.set_limits((-half, half))
 
         # move to original position
         await self.move_relative((ref - lo) - half)
 
-    def stop(self, emergency=False):
-        self.parent.send_cmd("\\")
+    async def stop(self, emergency=False):
+        await self.parent.send_cmd(b"\\")
+
+    async def is_busy(self):
+        return await self.parent.is_busy()
 
     async def wait(self):
-        while self.is_busy:
-            await trio.sleep(1)
+        # STATUS is reported for the entire controller
+        await self.parent.wait()
+
+    def encode_position(self, pos):
+        """
+        Encode position as the "X=steps" argument of a motion command.
+
+        Args:
+            pos (float): position in physical units
+        Returns:
+            (bytes) command fragment
+        """
+        # 0.1 micron per unit step
+        pos *= self._multiplier
+        # remove decimal
+        return self._assign(int(pos))
+
+    def _assign(self, value):
+        return b"%s=%s" % (self._axis_key, _encode(value))
 
     ##
 
@@ -200,16 +243,16 @@ class ASIAxis(Axis):
     def info(self):
         return self._info
 
-    @property
-    def is_busy(self):
-        return self.parent.is_busy
-
     @property
     def is_opened(self):
         return self.info is not None
 
 
 class ASISerialCommandController(MotionController):
+    # command prefix and response terminator of the serial protocol
+    address = b""
+    terminator = b"\r\n"
+
     def __init__(self, driver, port, *args, baudrate=115200, **kwargs):
         super().__init__(driver, *args, **kwargs)
 
@@ -217,28 +260,154 @@ class ASISerialCommandController(MotionController):
         ser.port = port
         ser.baudrate = baudrate
         self._handle, self._lock = ser, trio.StrictFIFOLock()
+        self._low_latency, self._low_latency_warned = False, False
+
+        self._status_cmd = self._build_cmd("/")
+        self._busy_cache = (-math.inf, None)
+
+        self._rx_buffer = bytearray(RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buffer)
+        self._rx_size = 0
 
         self._info = None
 
     ##
 
     async def _open(self):
-        self.handle.open()
+        await self._open_port()
 
         # create info
-        model = self.send_cmd("BU")
-        version = self.send_cmd("V")
+        model = await self.send_cmd("BU")
+        version = await self.send_cmd("V")
         self._info = DeviceInfo(vendor="ASI", model=model, version=version)
 
     async def _close(self):
         self._info = None
-        self.handle.close()
+        self.invalidate_cache()
+        await self._close_port()
+
+    def invalidate_cache(self):
+        """Drop cached controller responses, e.g. after a reconnect."""
+
+    async def _open_port(self):
+        await trio.to_thread.run_sync(self.handle.open)
+
+        # default FTDI latency timer (16 ms) caps the command rate, request 1 ms
+        try:
+            enabled = await trio.to_thread.run_sync(self._get_low_latency_mode)
+            if not enabled:
+                await trio.to_thread.run_sync(
+                    partial(self.handle.set_low_latency_mode, True)
+                )
+                # only restore the flag if it is changed by us
+                self._low_latency = True
+        except (AttributeError, NotImplementedError, IOError, ValueError) as err:
+            # not supported by the platform or the serial driver, probes reopen the
+            # port frequently, warn once
+            log = logger.debug if self._low_latency_warned else logger.warning
+            log(f"unable to enable low latency mode, {err}")
+            self._low_latency_warned = True
+
+    async def _close_port(self):
+        if self._low_latency:
+            try:
+                await trio.to_thread.run_sync(
+                    partial(self.handle.set_low_latency_mode, False)
+                )
+            except (IOError, ValueError) as err:
+                logger.warning(f"unable to restore latency mode, {err}")
+            self._low_latency = False
+        await trio.to_thread.run_sync(self.handle.close)
+        # drop stale bytes from the previous session
+        self._rx_size = 0
+
+    def _get_low_latency_mode(self):
+        """Query ASYNC_LOW_LATENCY of the tty, it persists beyond this process."""
+        if fcntl is None or not hasattr(termios, "TIOCGSERIAL"):
+            raise NotImplementedError("TIOCGSERIAL is not supported")
+        buf = array.array("i", [0] * 32)
+        fcntl.ioctl(self.handle.fileno(), termios.TIOCGSERIAL, buf)
+        return bool(buf[4] & ASYNC_LOW_LATENCY)
 
     ##
 
     async def enumerate_properties(self):
         return tuple()
 
+    async def _probe_axes(self, axes):
+        """
+        Test all the axes in one batch instead of opening them one by one.
+
+        Args:
+            axes (iterable of str): axis identifiers
+        Returns:
+            (tuple of ASIAxis) connected axes
+        """
+        axes = [ASIAxis(self, axis) for axis in axes]
+        # disconnected axis reports "D"
+        flags = await self.send_cmds([(b"RS", axis._axis_limit_query) for axis in axes])
+        return tuple(axis for axis, flag in zip(axes, flags) if flag != "D")
+
+    ##
+
+    async def move_absolute(self, positions, blocking=True):
+        """
+        Move multiple axes to their absolute positions in a single command.
+
+        Args:
+            positions (dict): target position of each ASIAxis
+            blocking (bool): wait until the controller is idle
+        """
+        await self._move(b"M", positions, blocking)
+
+    async def move_relative(self, positions, blocking=True):
+        """
+        Move multiple axes by their relative offsets in a single command.
+
+        Args:
+            positions (dict): offset of each ASIAxis
+            blocking (bool): wait until the controller is idle
+        """
+        await self._move(b"R", positions, blocking)
+
+    async def _move(self, cmd, positions, blocking):
+        if not positions:
+            raise ValueError("no axis to move")
+        for axis in positions:
+            if axis.parent is not self:
+                raise ValueError(f"axis {axis.axis} belongs to another controller")
+
+        # all the axes start simultaneously
+        steps = [axis.encode_position(pos) for axis, pos in positions.items()]
+        await self.send_cmd(cmd, *steps)
+        await trio.sleep(0)
+        if blocking:
+            await self.wait()
+
+    async def is_busy(self):
+        """
+        STATUS is handles quickly in the ASI command parser. The official way to rapid poll.
+        """
+        async with self.lock:
+            # waiters queued behind the lock reuse the STATUS polled ahead of them
+            timestamp, busy = self._busy_cache
+            if trio.current_time() - timestamp < BUSY_CACHE_TTL:
+                return busy
+
+            # reply is a bare "B" or "N", skip the response parser
+            (response,) = await self._run_transact(self._status_cmd, 1)
+            busy = response[:1] == b"B"
+
+            self._busy_cache = (trio.current_time(), busy)
+            return busy
+
+    async def wait(self):
+        # start with rapid polls and back off for long moves
+        interval = POLL_INTERVAL_MIN
+        while await self.is_busy():
+            await trio.sleep(interval)
+            interval = min(interval * 1.5, POLL_INTERVAL_MAX)
+
     ##
 
     @property
@@ -249,14 +418,6 @@ class ASISerialCommandController(MotionController):
     def info(self):
         return self._info
 
-    @property
-    def is_busy(self):
-        """
-        STATUS is handles quickly in the ASI command parser. The official way to rapid poll.
-        """
-        response = self.send_cmd("/")
-        return response == "B"
-
     @property
     def is_opened(self):
         return self.handle.is_open
@@ -267,39 +428,114 @@ class ASISerialCommandController(MotionController):
 
     ##
 
-    def send_cmd(self, *args, address="", term=b"\r\n", **kwargs):
-        # 1) compact
-        args = [str(arg) for arg in args]
-        kwargs = [f"{str(k)}={v}" for k, v in kwargs.items()]
+    async def send_cmd(self, *args, **kwargs):
+        cmd = self._build_cmd(*args, **kwargs)
+        (response,) = await self._transact(cmd)
+        return self._check_error(response)
 
-        # 2) join
-        cmd = " ".join(args + kwargs)
+    async def send_cmds(self, cmds):
+        """
+        Send multiple commands in a single write and collect their responses.
+
+        Args:
+            cmds (list of tuple): positional arguments of each command
+        Returns:
+            (tuple) responses, in the same order as the commands
+        """
+        cmds = [self._build_cmd(*args) for args in cmds]
 
-        # 3) response format
-        cmd = f"{address}{cmd}\r".encode()
-        # logger.debug(f"SEND {cmd}")
+        # drain every response before interpreting errors, otherwise the remaining
+        # responses are left behind in the buffer
+        responses = await self._transact(b"".join(cmds), len(cmds))
+        return tuple(self._check_error(response) for response in responses)
 
-        # 4) send
+    async def _transact(self, cmd, n_responses=1):
+        """
+        Write the command buffer and read back raw responses in a worker thread.
+
+        The transaction is not cancellable, an abandoned thread would keep using the
+        port after the lock is released.
+        """
+        async with self.lock:
+            # any other command may change the motion state
+            self._busy_cache = (-math.inf, None)
+            return await self._run_transact(cmd, n_responses)
+
+    async def _run_transact(self, cmd, n_responses):
+        return await trio.to_thread.run_sync(self._blocking_transact, cmd, n_responses)
+
+    def _blocking_transact(self, cmd, n_responses):
         self.handle.write(cmd)
+        return [self._read_raw_response() for _ in range(n_responses)]
+
+    def _build_cmd(self, *args, **kwargs):
+        # fast path for the most common query form, e.g. "MC X?"
+        if not kwargs and len(args) == 2:
+            return b"%s%s %s\r" % (self.address, _encode(args[0]), _encode(args[1]))
+
+        cmd, sep = bytearray(self.address), b""
+        for arg in args:
+            cmd += sep
+            cmd += _encode(arg)
+            sep = b" "
+        for key, value in kwargs.items():
+            cmd += sep
+            cmd += b"%s=%s" % (_encode(key), _encode(value))
+            sep = b" "
+        cmd += b"\r"
+
+        return cmd
+
+    def _read_raw_response(self):
+        # ... multi-line response is kept as is, lines are separated by "\r"
+        return self._readline().rstrip()
+
+    def _readline(self):
+        """
+        Read a response into the reusable receive buffer, terminator excluded.
 
-        # 5) ack
-        response = self.handle.read_until(term)
-        response = response[: -len(term)]
-        # ... ensure multi-line response is received properly
-        response = response.replace(b"\r", b"\n")
-        response = response.decode("ascii").rstrip()
-        # logger.debug(f"RECV {response}")
-        response = self._check_error(response)
+        Bytes past the terminator belong to the following responses of a batch, they
+        are kept in the buffer for the next call.
+        """
+        term, buffer, size = self.terminator, self._rx_buffer, self._rx_size
+
+        offset = 0
+        while True:
+            index = buffer.find(term, offset, size)
+            if index >= 0:
+                break
+            offset = max(size - len(term) + 1, 0)
+
+            if size == len(buffer):
+                buffer = self._grow_rx_buffer()
+            # read whatever is available, block on at least one byte, pyserial still
+            # allocates inside readinto, the saving is in the number of read calls
+            n = min(max(self.handle.in_waiting, 1), len(buffer) - size)
+            size += self.handle.readinto(self._rx_view[size : size + n])
+        response = bytes(self._rx_view[:index])
+
+        end = index + len(term)
+        self._rx_size = size - end
+        if self._rx_size:
+            buffer[: self._rx_size] = buffer[end:size]
 
         return response
 
+    def _grow_rx_buffer(self):
+        # buffer cannot be resized while the view is exported
+        self._rx_view.release()
+        self._rx_buffer.extend(bytes(len(self._rx_buffer)))
+        self._rx_view = memoryview(self._rx_buffer)
+        return self._rx_buffer
+
     def _check_error(self, response):
-        if response.startswith(":N"):
+        """Interpret the raw response, only the payload is decoded."""
+        if response.startswith(b":N"):
             errno = int(response[3:])  # neglect the sign
             ASISerialCommandController.interpret_error(errno)
-        elif response.startswith(":A"):
-            return response[2:].strip()
-        return response
+        elif response.startswith(b":A"):
+            response = response[2:].strip()
+        return response.decode("ascii")
 
     @staticmethod
     def interpret_error(errno):
@@ -17,7 +17,7 @@ class MS2000(ASISerialCommandController):
             await self.open()
 
             # test controller string
-            name = self.send_cmd("N")
+            name = await self.send_cmd("N")
             if not name.startswith("ASI-MS2000"):
                 raise UnsupportedClassError
             logger.info(f".. {self.info}")
@@ -25,10 +25,10 @@ class MS2000(ASISerialCommandController):
             await self.close()
 
     async def _open(self):
-        self.handle.open()
+        await self._open_port()
 
         # create info
-        version = self.send_cmd("V")
+        version = await self.send_cmd("V")
         _, version = version.split(" ")
         self._info = DeviceInfo(vendor="ASI", model="MS2000", version=version)
 
@@ -40,27 +40,22 @@ class MS2000(ASISerialCommandController):
     ##
 
     async def enumerate_axes(self) -> Union[ASIAxis]:
-        fw_info = self.send_cmd("BU")
+        fw_info = await self.send_cmd("BU")
         axes = set(fw_info.split("_")[1])
-
-        valid_axes = []
-        for axis in axes:
-            try:
-                axis = ASIAxis(self, axis)
-                await axis.test_open()
-                valid_axes.append(axis)
-            except UnsupportedClassError:
-                pass
-        return tuple(valid_axes)
+        return await self._probe_axes(axes)
 
 
 class LX4000(MS2000):
+    # TODO switch address
+    address = b"3H"
+    terminator = b"\r\n\3"
+
     async def test_open(self):
         try:
             await self.open()
 
             # test controller string
-            name = self.send_cmd("N")
+            name = await self.send_cmd("N")
             if not name.startswith("ASI-MS2000"):
                 raise UnsupportedClassError
             logger.info(f".. {self.info}")
@@ -68,17 +63,10 @@ class LX4000(MS2000):
             await self.close()
 
     async def _open(self):
-        self.handle.open()
+        await self._open_port()
 
         # create info
-        version = self.send_cmd("V")
+        version = await self.send_cmd("V")
         _, version = version.split(" ")
         self._info = DeviceInfo(vendor="ASI", model="LX4000", version=version)
 
-    ##
-
-    def send_cmd(self, *args, **kwargs):
-        kwargs.update({"address": "3H", "term": b"\r\n\3"})
-        # TODO switch address
-        return super().send_cmd(*args, **kwargs)
-
@@ -1,4 +1,6 @@
+import json
 import logging
+import re
 from typing import Union
 
 from olive.devices.errors import UnsupportedClassError
@@ -9,8 +11,15 @@ __all__ = ["Tiger"]
 
 logger = logging.getLogger(__name__)
 
+# "At 31: COMM v2.8 TIGER_COMM ..." -> address, function, version, character
+CARD_PATTERN = re.compile(r"\D*(\d+):\s*(\S+)\s+(\S+)\s+(\S+)")
+
 
 class Tiger(ASISerialCommandController):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cards = None
+
     async def test_open(self):
         try:
             await self.open()
@@ -22,43 +31,46 @@ class Tiger(ASISerialCommandController):
         finally:
             await self.close()
 
+    def invalidate_cache(self):
+        super().invalidate_cache()
+        self._cards = None
+
     ##
 
     async def enumerate_properties(self):
         return ("cards",)
 
     async def _get_cards(self):
-        response = self.send_cmd("N")
-        cards = []
-        for line in response.split("\n"):
-            # strip card address
-            address, line = line.split(":", maxsplit=1)
-            address = int(address[3:])
+        # card layout is fixed during a session
+        if self._cards is not None:
+            return self._cards
 
-            # split options
-            line = line.strip()
-            function, version, character, *options = line.split(" ")
+        response = await self.send_cmd("N")
+        cards = []
+        for line in response.splitlines():
+            match = CARD_PATTERN.match(line)
+            if match is None:
+                continue
+            address, function, version, character = match.groups()
 
             cards.append(
                 {
-                    "address": address,
+                    "address": int(address),
                     "character": character,
                     "version": version,
                     "function": function,
                 }
             )
-        return tuple(cards)
+        self._cards = tuple(cards)
+        return self._cards
 
     ##
 
     async def enumerate_axes(self) -> Union[ASIAxis]:
         cards = await self.get_property("cards")
 
-        print(">>>")
-        import json  # noqa
-
-        print(json.dumps(cards, indent=4))
-        print("<<<")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"cards: {json.dumps(cards, indent=4)}")
 
         axes = []
         for card in cards:
@@ -69,13 +81,5 @@ class Tiger(ASISerialCommandController):
             for motor in motors:
                 axes.append(motor.split(":", maxsplit=1)[0])
 
-        valid_axes = []
         logger.debug("TESTING VALID AXES")
-        for axis in axes:
-            try:
-                axis = ASIAxis(self, axis)
-                await axis.test_open()
-                valid_axes.append(axis)
-            except UnsupportedClassError:
-                pass
-        return tuple(valid_axes)
+        return await self._probe_axes(axes)
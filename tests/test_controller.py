@@ -20,16 +20,16 @@ async def action(axis):
         logger.info(f"{axis_id}, 0, open")
         await axis.open()
 
-        vel = axis.get_velocity()
+        vel = await axis.get_velocity()
         logger.info(f"{axis_id}, velocity: {vel}")
-        limits = axis.get_limits()
+        limits = await axis.get_limits()
         logger.info(f"{axis_id}, limits: {limits}")
 
         await axis.calibrate()
 
-        limits = axis.get_limits()
+        limits = await axis.get_limits()
         logger.info(f"{axis_id}, limits: {limits}")
-        pos = axis.get_position()
+        pos = await axis.get_position()
         logger.info(f"{axis_id}, pos: {pos}")
 
         logger.info(f"{axis_id}, 1, reset")
@@ -0,0 +1,179 @@
+import pytest
+import trio
+import trio.testing
+
+pytest.importorskip("serial")
+pytest.importorskip("olive.devices")
+
+from olive.devices.errors import UnknownCommandError  # noqa: E402
+from olive.drivers.asi import ASIAxis, LX4000, Tiger  # noqa: E402
+from olive.drivers.asi.base import BUSY_CACHE_TTL, RX_BUFFER_SIZE  # noqa: E402
+
+
+class FakeSerial:
+    """In-memory serial port, replies are queued as soon as a command is written."""
+
+    def __init__(self, replies, terminator=b"\r\n", chunk=None):
+        self.replies = replies
+        self.terminator = terminator
+        self.chunk = chunk
+        self.rx = bytearray()
+        self.written = []
+        self.is_open = True
+
+    def write(self, data):
+        data = bytes(data)
+        self.written.append(data)
+        for cmd in data.split(b"\r")[:-1]:
+            self.rx += self.replies[cmd] + self.terminator
+        return len(data)
+
+    @property
+    def in_waiting(self):
+        return len(self.rx) if self.chunk is None else 0
+
+    def readinto(self, b):
+        n = len(b) if self.chunk is None else min(len(b), self.chunk)
+        data, self.rx[:n] = bytes(self.rx[:n]), b""
+        b[: len(data)] = data
+        return len(data)
+
+    def commands(self):
+        return [cmd for data in self.written for cmd in data.split(b"\r")[:-1]]
+
+
+def make_controller(klass, replies, **kwargs):
+    controller = klass(None, "fake")
+    controller._handle = FakeSerial(replies, terminator=klass.terminator, **kwargs)
+    return controller
+
+
+def run(fn, *args, clock=None):
+    return trio.run(fn, *args, clock=clock)
+
+
+##
+
+
+def test_build_cmd():
+    controller = make_controller(Tiger, {})
+    assert controller._build_cmd("MC", "X?") == b"MC X?\r"
+    assert controller._build_cmd(b"M", b"X=1", b"Y=2") == b"M X=1 Y=2\r"
+    assert controller._build_cmd("SL", X=-1.5) == b"SL X=-1.5\r"
+    assert controller._build_cmd("/") == b"/\r"
+
+
+def test_send_cmd_strips_ack():
+    controller = make_controller(Tiger, {b"W X": b":A 12345"})
+    assert run(controller.send_cmd, "W", "X") == "12345"
+
+
+def test_send_cmd_raises_error():
+    controller = make_controller(Tiger, {b"XX": b":N-1"})
+    with pytest.raises(UnknownCommandError):
+        run(controller.send_cmd, "XX")
+
+
+def test_send_cmds_splits_batched_replies():
+    replies = {b"RS X-": b":A N", b"RS Y-": b":A D", b"W Z": b":A 42"}
+    controller = make_controller(Tiger, replies)
+
+    responses = run(controller.send_cmds, [("RS", "X-"), ("RS", "Y-"), ("W", "Z")])
+
+    assert responses == ("N", "D", "42")
+    # single write for the entire batch
+    assert controller.handle.written == [b"RS X-\rRS Y-\rW Z\r"]
+    assert controller._rx_size == 0
+
+
+def test_send_cmds_drains_before_raising():
+    replies = {b"XX": b":N-1", b"W X": b":A 1"}
+    controller = make_controller(Tiger, replies)
+
+    with pytest.raises(UnknownCommandError):
+        run(controller.send_cmds, [("XX",), ("W", "X")])
+    # the stream stays in sync for the next command
+    assert run(controller.send_cmd, "W", "X") == "1"
+
+
+def test_readline_keeps_trailing_bytes():
+    controller = make_controller(Tiger, {})
+    controller.handle.rx += b"first\r\nsecond\r\n"
+
+    assert controller._readline() == b"first"
+    assert controller._readline() == b"second"
+    assert controller._rx_size == 0
+
+
+def test_readline_byte_at_a_time():
+    controller = make_controller(Tiger, {}, chunk=1)
+    controller.handle.rx += b"one\r\ntwo\r\n"
+
+    assert controller._readline() == b"one"
+    assert controller._readline() == b"two"
+
+
+def test_readline_grows_buffer():
+    controller = make_controller(Tiger, {})
+    payload = b"x" * (RX_BUFFER_SIZE * 3)
+    controller.handle.rx += payload + b"\r\n"
+
+    assert controller._readline() == payload
+    assert len(controller._rx_buffer) > RX_BUFFER_SIZE
+
+
+def test_lx4000_address_and_terminator():
+    controller = make_controller(LX4000, {b"3HW X": b":A 7"})
+
+    assert run(controller.send_cmd, "W", "X") == "7"
+    assert controller.handle.written == [b"3HW X\r"]
+    assert controller.handle.rx == b""
+
+
+def test_multi_line_response():
+    cards = b"At 30: X:XS,Y:XS v3.1 SCAN_XY_LED\rAt 32: COMM v2.8 TIGER_COMM"
+    controller = make_controller(Tiger, {b"N": cards})
+
+    cards = run(controller._get_cards)
+    assert [card["address"] for card in cards] == [30, 32]
+    assert cards[0]["function"] == "X:XS,Y:XS"
+
+
+##
+
+
+def test_is_busy_shares_recent_status():
+    controller = make_controller(Tiger, {b"/": b"B", b"W X": b":A 1"})
+    clock = trio.testing.MockClock()
+
+    async def main():
+        assert await controller.is_busy()
+        assert await controller.is_busy()
+        assert controller.handle.commands().count(b"/") == 1
+
+        # cache expires
+        clock.jump(BUSY_CACHE_TTL * 2)
+        assert await controller.is_busy()
+        assert controller.handle.commands().count(b"/") == 2
+
+        # any other command invalidates the cache
+        await controller.send_cmd("W", "X")
+        assert await controller.is_busy()
+        assert controller.handle.commands().count(b"/") == 3
+
+    run(main, clock=clock)
+
+
+def test_move_rejects_empty_positions():
+    controller = make_controller(Tiger, {})
+    with pytest.raises(ValueError):
+        run(controller.move_absolute, {})
+    assert controller.handle.written == []
+
+
+def test_move_rejects_foreign_axis():
+    controller = make_controller(Tiger, {})
+    other = make_controller(Tiger, {})
+    with pytest.raises(ValueError):
+        run(controller.move_absolute, {ASIAxis(other, "X"): 1.0})
+    assert controller.handle.written == []